@@ -0,0 +1,62 @@
+# coding: utf-8 -*-
+"""Import-time benchmark for ``clg.table``.
+
+Import the module in fresh interpreters, report the best import time and fail
+if it exceeds the threshold or if a deferred module is imported eagerly::
+
+    python benchmarks/import_time.py [--runs N] [--threshold MS]
+"""
+
+import os
+import sys
+import argparse
+import compileall
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only be imported when actually used.
+DEFERRED = ('subprocess', 'csv', 'dataclasses', 'logging', 'importlib.metadata')
+
+SCRIPT = '''
+import sys, time
+baseline = set(sys.modules)
+start = time.perf_counter()
+import clg.table
+elapsed = time.perf_counter() - start
+loaded = set(sys.modules) - baseline
+print(elapsed * 1000)
+print(' '.join(sorted(mod for mod in {deferred!r} if mod in loaded)))
+'''.format(deferred=DEFERRED)
+
+def measure():
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    output = subprocess.check_output([sys.executable, '-c', SCRIPT], env=env)
+    elapsed, loaded = (output.decode().split('\n') + [''])[:2]
+    return float(elapsed), loaded.split()
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark clg.table import time.')
+    parser.add_argument('-r', '--runs', type=int, default=20)
+    parser.add_argument('-t', '--threshold', type=float, default=3.0,
+                        help='maximum accepted import time in milliseconds')
+    args = parser.parse_args()
+
+    # Measure imports from up-to-date bytecode, whatever PYTHONDONTWRITEBYTECODE is.
+    compileall.compile_dir(os.path.join(ROOT, 'clg'), quiet=1)
+    results = [measure() for _ in range(args.runs)]
+    best = min(elapsed for elapsed, _ in results)
+    loaded = sorted(set(mod for _, mods in results for mod in mods))
+    print('import clg.table: {:.2f} ms (best of {:d})'.format(best, args.runs))
+
+    status = 0
+    if loaded:
+        print('error: deferred modules imported eagerly: {:s}'.format(', '.join(loaded)))
+        status = 1
+    if best > args.threshold:
+        print('error: import time above threshold ({:.2f} ms)'.format(args.threshold))
+        status = 1
+    return status
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,11 +1,7 @@
 # coding: utf-8 -*-
 
-import io
 import os
 import sys
-import csv
-import subprocess
-from dataclasses import dataclass
 
 STYLES = {
     'modern': {
@@ -37,32 +33,69 @@ STYLES = {
         'none': ' '
     }
 }
+
+# Output formats by name. Values are either a class or a 'module:attribute' string
+# which is only imported the first time the format is requested. Formats not found
+# here are searched in the 'clg.table.formats' entry points. Builtin formats are
+# registered at the end of the module.
+FORMATS = {}
+ENTRY_POINTS_GROUP = 'clg.table.formats'
 _SELF = sys.modules[__name__]
 
-# Define a cli logger.
-import logging
-logger = logging.getLogger('clg-table')
-logger.setLevel('WARN')
-cli_handler = logging.StreamHandler()
-cli_handler.setFormatter(logging.Formatter('(clg-table) %(levelname)s: %(message)s'))
-logger.addHandler(cli_handler)
-
-@dataclass
-class ColumnWidths:
-    width: int
-    min_width: int
-    max_width: int
-    text_width: int
-
-@dataclass
-class BorderVisibility:
-    top: bool
-    right: bool
-    bottom: bool
-    left: bool
-
-term_width = lambda: int(subprocess.check_output(['tput', 'cols']))
-term_height = lambda: int(subprocess.check_output(['tput', 'lines']))
+def __getattr__(name):
+    # The cli logger is only defined on first access as importing and configuring
+    # logging is costly for short-lived commands.
+    if name in ('logger', 'cli_handler'):
+        import logging
+        logger = logging.getLogger('clg-table')
+        logger.setLevel('WARN')
+        cli_handler = logging.StreamHandler()
+        cli_handler.setFormatter(logging.Formatter('(clg-table) %(levelname)s: %(message)s'))
+        logger.addHandler(cli_handler)
+        globals().update(logger=logger, cli_handler=cli_handler)
+        return globals()[name]
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+class _Record:
+    """Base for simple records, comparable and printable like dataclasses."""
+    __slots__ = ()
+    __hash__ = None
+
+    def __repr__(self):
+        return '{:s}({:s})'.format(
+            type(self).__name__,
+            ', '.join('{:s}={!r}'.format(attr, getattr(self, attr)) for attr in self.__slots__))
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, attr) == getattr(other, attr) for attr in self.__slots__)
+
+class ColumnWidths(_Record):
+    __slots__ = ('width', 'min_width', 'max_width', 'text_width')
+
+    def __init__(self, width, min_width, max_width, text_width):
+        self.width = width
+        self.min_width = min_width
+        self.max_width = max_width
+        self.text_width = text_width
+
+class BorderVisibility(_Record):
+    __slots__ = ('top', 'right', 'bottom', 'left')
+
+    def __init__(self, top, right, bottom, left):
+        self.top = top
+        self.right = right
+        self.bottom = bottom
+        self.left = left
+
+def term_width():
+    import subprocess
+    return int(subprocess.check_output(['tput', 'cols']))
+
+def term_height():
+    import subprocess
+    return int(subprocess.check_output(['tput', 'lines']))
 
 class CLGTableError(Exception):
     pass
@@ -92,23 +125,274 @@ class Buffer(list):
             self.append(value)
             return self[index]
 
+def register_format(name, output_class):
+    """Register an output format. ``output_class`` is either a class or a
+    'module:attribute' string which is imported on first use."""
+    FORMATS[name] = output_class
+
+def _load_entry_point(name):
+    from importlib import metadata
+    try:
+        entry_points = metadata.entry_points(group=ENTRY_POINTS_GROUP)
+    except TypeError:
+        # Python < 3.10 returns a dict of entry points by group.
+        entry_points = metadata.entry_points().get(ENTRY_POINTS_GROUP, [])
+    for entry_point in entry_points:
+        if entry_point.name == name:
+            return entry_point.load()
+    return None
+
+def get_format(name):
+    """Return the output class of the format ``name``, loading it if needed."""
+    output_class = FORMATS.get(name)
+    if output_class is None:
+        output_class = _load_entry_point(name)
+        if output_class is None:
+            raise CLGTableError("unknown output format '{:s}'".format(name))
+    elif isinstance(output_class, str):
+        import importlib
+        if output_class.count(':') != 1:
+            raise CLGTableError("invalid path '{:s}' for output format '{:s}' "
+                                "(expected 'module:attribute')".format(output_class, name))
+        module_name, attr = output_class.split(':')
+        output_class = getattr(importlib.import_module(module_name), attr)
+    FORMATS[name] = output_class
+    return output_class
+
 def init(args, **kwargs):
     output_format = args.format or 'text'
-    output_class = getattr(_SELF, '{:s}Table'.format(output_format.capitalize()))
+    output_class = get_format(output_format)
 
     params = {'page': args.page or False,
               'output_file': args.output_file or None}
-    if args.format == 'text':
+    if output_format == 'text':
         params.update(widths=kwargs.pop('widths', []),
                       title=kwargs.pop('title', None),
                       style=kwargs.pop('style', 'modern'),
                       text_color=kwargs.pop('text_color', None),
                       border_color=kwargs.pop('border_color', None))
-    if args.format == 'csv':
+    if output_format == 'csv':
         params.update(separator=args.csv_separator or ';')
 
     return output_class(**params)
 
+def get_columns_widths(rows, available_width=None):
+    """Return the widths of the columns of ``rows`` fitting in ``available_width``
+    (the terminal width by default)."""
+    columns_widths = []
+    widths = []
+    # For each column, get minimal, defined, maximal and text width.
+    for row in rows:
+        for col_idx, cell in enumerate(row.cells):
+            if col_idx >= len(columns_widths):
+                columns_widths.append(ColumnWidths(-1, -1, -1, -1))
+            column_widths = columns_widths[col_idx]
+            column_widths.width = max((cell.width, column_widths.width))
+            column_widths.min_width = max((cell.get_min_width(), column_widths.min_width))
+            column_widths.max_width = max((cell.max_width, column_widths.max_width))
+            column_widths.text_width = max((cell.get_text_width(), column_widths.text_width))
+
+    # Distribute widths based on terminal width and number of borders.
+    if available_width is None:
+        available_width = term_width()
+    remaining_size = available_width - len(columns_widths) - 1
+    status = []
+    for column in columns_widths:
+        if column.width != -1:
+            widths.append(column.width)
+            status.append(True)
+            remaining_size -= column.width
+        else:
+            widths.append(column.min_width)
+            status.append(True if column.text_width <= column.min_width else False)
+            remaining_size -= column.min_width
+
+    while True:
+        if remaining_size <= 0 or all(status):
+            break
+
+        for idx, column in enumerate(columns_widths):
+            if status[idx]:
+                continue
+
+            preferred_width = (
+                column.max_width if column.max_width != -1 else column.text_width)
+
+            # Increment current column.
+            if widths[idx] < preferred_width:
+                widths[idx] += 1
+                remaining_size -= 1
+
+                # Mark column as done if column's width is equal to preferred width.
+                if widths[idx] == preferred_width:
+                    status[idx] = True
+
+                # Stop here if there is nothinh remaining.
+                if remaining_size <= 0:
+                    break
+
+    # Check there is no overflow or throw a warning.
+    if remaining_size < 0:
+        _SELF.logger.warning(
+            'unable to adapt size (terminal size: {:d}, overflow: {:d})!'
+            .format(available_width, -remaining_size))
+    return widths
+
+
+# Borders mappings by style, compiled on first use (see get_borders).
+_BORDERS = {}
+
+def _compile_condition(key):
+    """Convert a condition key of a borders mapping to a ``(row offset, column offset,
+    x, y, side)`` tuple. ``x`` and ``y`` are None when only the border of the cell
+    is checked (no '&' in the key)."""
+    row_offset, col_offset = 0, 0
+    if key.startswith('+'):
+        key = key[1:]
+        row_offset, col_offset = (1, 0) if key in ('left', 'right') else (0, 1)
+    if key.startswith('&'):
+        x, y = (1, 0) if key in ('left', 'right') else (0, 1)
+        return (row_offset, col_offset, x, y, key[1:])
+    return (row_offset, col_offset, None, None, key)
+
+def _compile_mapping(mapping):
+    """Convert a mapping of symbols by borders visibility to a tree of
+    ``(condition, symbol if visible, symbol if hidden)`` tuples."""
+    if not isinstance(mapping, dict):
+        return mapping
+    key = max(mapping)
+    return (_compile_condition(key),
+            _compile_mapping(mapping[key]),
+            _compile_mapping(mapping['!' + key]))
+
+def get_borders(style):
+    """Return the compiled borders mappings of ``style``. They are built once and
+    shared by all tables using this style."""
+    if style not in _BORDERS:
+        symbols = STYLES[style]
+        mappings = {
+        'topleft': {'top':
+                       {'left': symbols['topleft'],
+                        '!left': symbols['horizontal']},
+                    '!top':
+                       {'left': symbols['vertical'],
+                        '!left': symbols['none']}},
+        'tophoriz': {'top': symbols['horizontal'],
+                     '!top': symbols['none']},
+        'topright': {'top':
+                        {'right': symbols['topright'],
+                         '!right': symbols['horizontal']},
+                     '!top':
+                        {'right': symbols['vertical'],
+                         '!right': symbols['none']}},
+        'topright_inner': {'top':
+                              {'+top':
+                                  {'&right': symbols['topinter'],
+                                   '!&right': symbols['horizontal']},
+                               '!+top':
+                                  {'&right': symbols['topright'],
+                                   '!&right': symbols['horizontal']}},
+                           '!top':
+                              {'+top':
+                                  {'&right': symbols['topleft'],
+                                   '!&right': symbols['horizontal']},
+                               '!+top':
+                                  {'&right': symbols['vertical'],
+                                   '!&right': symbols['none']}}},
+        'leftvert': {'left': symbols['vertical'],
+                     '!left': symbols['none']},
+        'rightvert': {'&right': symbols['vertical'],
+                      '!&right': symbols['none']},
+        'bottomleft': {'left':
+                          {'bottom': symbols['bottomleft'],
+                           '!bottom': symbols['vertical']},
+                       '!left':
+                          {'bottom': symbols['horizontal'],
+                           '!bottom': symbols['none']}},
+        'bottomleft_inner': {'left':
+                                {'+left':
+                                    {'&bottom': symbols['leftinter'],
+                                     '!&bottom': symbols['vertical']},
+                                 '!+left':
+                                    {'&bottom': symbols['bottomleft'],
+                                     '!&bottom': symbols['none']}},
+                             '!left':
+                                {'+left':
+                                    {'&bottom': symbols['topleft'],
+                                     '!&bottom': symbols['none']},
+                                 '!+left':
+                                    {'&bottom': symbols['horizontal'],
+                                     '!&bottom': symbols['none']}}},
+        'bottomhoriz': {'&bottom': symbols['horizontal'],
+                        '!&bottom': symbols['none']},
+        'bottomright': {'right':
+                           {'bottom': symbols['bottomright'],
+                            '!bottom': symbols['vertical']},
+                        '!right':
+                           {'bottom': symbols['horizontal'],
+                            '!bottom': symbols['none']}},
+        'bottomright_lastcol': {'right':
+                                   {'+right':
+                                       {'&bottom': symbols['rightinter'],
+                                        '!&bottom': symbols['vertical']},
+                                    '!+right':
+                                       {'&bottom': symbols['bottomright'],
+                                        '!&bottom': symbols['none']}},
+                                '!right':
+                                   {'+right':
+                                       {'&bottom': symbols['topright'],
+                                        '!&bottom': symbols['none']},
+                                    '!+right':
+                                       {'&bottom': symbols['horizontal'],
+                                        '!&bottom': symbols['none']}}},
+        'bottomright_lastrow': {'bottom':
+                                   {'&right':
+                                       {'+bottom': symbols['bottominter'],
+                                        '!+bottom': symbols['bottomright']},
+                                    '!&right':
+                                       {'+bottom': symbols['horizontal'],
+                                        '!+bottom': symbols['none']}},
+                                '!bottom':
+                                   {'&right':
+                                       {'+bottom': symbols['bottomleft'],
+                                        '!+bottom': symbols['vertical']},
+                                    '!&right':
+                                       {'+bottom': symbols['none'],
+                                        '!+bottom': symbols['none']}}},
+        'bottomright_inner': {'&right':
+                                 {'&bottom':
+                                     {'+&right':
+                                         {'+&bottom': symbols['intersection'],
+                                          '!+&bottom': symbols['rightinter']},
+                                      '!+&right':
+                                         {'+&bottom': symbols['bottominter'],
+                                          '!+&bottom': symbols['bottomright']}},
+                                  '!&bottom':
+                                     {'+&right':
+                                         {'+&bottom': symbols['leftinter'],
+                                          '!+&bottom': symbols['vertical']},
+                                      '!+&right':
+                                         {'+&bottom': symbols['bottomleft'],
+                                          '!+&bottom': symbols['none']}}},
+                              '!&right':
+                                 {'&bottom':
+                                     {'+&right':
+                                         {'+&bottom': symbols['topinter'],
+                                          '!+&bottom': symbols['topright']},
+                                      '!+&right':
+                                         {'+&bottom': symbols['horizontal'],
+                                          '!+&bottom': symbols['none']}},
+                                  '!&bottom':
+                                     {'+&right':
+                                         {'+&bottom': symbols['topleft'],
+                                          '!+&bottom': symbols['none']},
+                                      '!+&right':
+                                         {'+&bottom': symbols['horizontal'],
+                                          '!+&bottom': symbols['none']}}}}}
+        _BORDERS[style] = {name: _compile_mapping(mapping)
+                           for name, mapping in mappings.items()}
+    return _BORDERS[style]
+
 
 class Row:
     def __init__(self, *cells):
@@ -250,16 +534,22 @@ class Table(list):
     def flush(self):
         lines = '\n'.join(''.join(line) for line in self.render())
         self.rows = []
+        self._output([lines])
 
+    def _output(self, chunks):
+        """Write each chunk of text, one after another, to the output file, the
+        pager or stdout."""
         if self.output_file:
             with open(self.output_file, 'w') as fhandler:
-                fhandler.write(lines)
+                for idx, lines in enumerate(chunks):
+                    fhandler.write(('\n' if idx else '') + lines)
         elif self.page:
-            import os, pydoc
+            import pydoc
             os.environ['PAGER'] = 'less -r -c'
-            pydoc.pager(lines)
+            pydoc.pager('\n'.join(chunks))
         else:
-            print(lines)
+            for lines in chunks:
+                print(lines)
 
 
 class TextTable(Table):
@@ -279,181 +569,51 @@ class TextTable(Table):
         last_col = col_idx == len(self.widths) - 1
 
         cell = self[row_idx].cells[col_idx]
+        borders = get_borders(self.style)
         symbol = None
         color = cell.border_color
         if side == 'topleft':
             if first_row and first_col:
-                symbol = self.get_symbol(
-                    row_idx, col_idx,
-                    {'top':
-                        {'left': STYLES[self.style]['topleft'],
-                         '!left': STYLES[self.style]['horizontal']},
-                     '!top':
-                        {'left': STYLES[self.style]['vertical'],
-                         '!left': STYLES[self.style]['none']}})
+                symbol = self.get_symbol(row_idx, col_idx, borders['topleft'])
         elif side == 'tophoriz':
             if first_row:
-                symbol = self.get_symbol(
-                    row_idx, col_idx,
-                    {'top': STYLES[self.style]['horizontal'],
-                     '!top': STYLES[self.style]['none']})
+                symbol = self.get_symbol(row_idx, col_idx, borders['tophoriz'])
 #                symbol = symbol * self.widths[col_idx]
         elif side == 'topright':
             if first_row and last_col:
-                symbol = self.get_symbol(
-                    row_idx, col_idx,
-                    {'top':
-                        {'right': STYLES[self.style]['topright'],
-                         '!right': STYLES[self.style]['horizontal']},
-                     '!top':
-                        {'right': STYLES[self.style]['vertical'],
-                         '!right': STYLES[self.style]['none']}})
+                symbol = self.get_symbol(row_idx, col_idx, borders['topright'])
             elif first_row:
-                symbol = self.get_symbol(
-                    row_idx, col_idx,
-                    {'top':
-                        {'+top':
-                            {'&right': STYLES[self.style]['topinter'],
-                             '!&right': STYLES[self.style]['horizontal']},
-                         '!+top':
-                            {'&right': STYLES[self.style]['topright'],
-                             '!&right': STYLES[self.style]['horizontal']}},
-                     '!top':
-                        {'+top':
-                            {'&right': STYLES[self.style]['topleft'],
-                             '!&right': STYLES[self.style]['horizontal']},
-                         '!+top':
-                            {'&right': STYLES[self.style]['vertical'],
-                             '!&right': STYLES[self.style]['none']}}})
+                symbol = self.get_symbol(row_idx, col_idx, borders['topright_inner'])
                 color = self.get_color(row_idx, col_idx, 1, 0) or cell.border_color
 
         elif side == 'leftvert':
             if first_col:
-                symbol = self.get_symbol(
-                    row_idx, col_idx,
-                    {'left': STYLES[self.style]['vertical'],
-                     '!left': STYLES[self.style]['none']})
+                symbol = self.get_symbol(row_idx, col_idx, borders['leftvert'])
         elif side == 'rightvert':
-            symbol = self.get_symbol(
-                row_idx, col_idx,
-                {'&right': STYLES[self.style]['vertical'],
-                 '!&right': STYLES[self.style]['none']})
+            symbol = self.get_symbol(row_idx, col_idx, borders['rightvert'])
             color = self.get_color(row_idx, col_idx, 1, 0) or cell.border_color
 
         elif side == 'bottomleft':
             if last_row and first_col:
-                symbol = self.get_symbol(
-                    row_idx, col_idx,
-                    {'left':
-                        {'bottom': STYLES[self.style]['bottomleft'],
-                         '!bottom': STYLES[self.style]['vertical']},
-                     '!left':
-                        {'bottom': STYLES[self.style]['horizontal'],
-                         '!bottom': STYLES[self.style]['none']}})
+                symbol = self.get_symbol(row_idx, col_idx, borders['bottomleft'])
             elif first_col:
-                symbol = self.get_symbol(
-                    row_idx, col_idx,
-                    {'left':
-                        {'+left':
-                            {'&bottom': STYLES[self.style]['leftinter'],
-                             '!&bottom': STYLES[self.style]['vertical']},
-                         '!+left':
-                            {'&bottom': STYLES[self.style]['bottomleft'],
-                             '!&bottom': STYLES[self.style]['none']}},
-                     '!left':
-                        {'+left':
-                            {'&bottom': STYLES[self.style]['topleft'],
-                             '!&bottom': STYLES[self.style]['none']},
-                         '!+left':
-                            {'&bottom': STYLES[self.style]['horizontal'],
-                             '!&bottom': STYLES[self.style]['none']}}})
+                symbol = self.get_symbol(row_idx, col_idx, borders['bottomleft_inner'])
                 color = self.get_color(row_idx, col_idx, 0, 1) or cell.border_color
         elif side == 'bottomhoriz':
-            symbol = self.get_symbol(
-                row_idx, col_idx,
-                {'&bottom': STYLES[self.style]['horizontal'],
-                 '!&bottom': STYLES[self.style]['none']})
+            symbol = self.get_symbol(row_idx, col_idx, borders['bottomhoriz'])
 #            symbol = symbol * self.widths[col_idx]
             color = self.get_color(row_idx, col_idx, 0, 1) or cell.border_color
         elif side == 'bottomright':
             if last_row and last_col:
-                symbol = self.get_symbol(
-                    row_idx, col_idx,
-                    {'right':
-                        {'bottom': STYLES[self.style]['bottomright'],
-                         '!bottom': STYLES[self.style]['vertical']},
-                     '!right':
-                        {'bottom': STYLES[self.style]['horizontal'],
-                         '!bottom': STYLES[self.style]['none']}})
+                symbol = self.get_symbol(row_idx, col_idx, borders['bottomright'])
             elif last_col:
-                symbol = self.get_symbol(
-                    row_idx, col_idx,
-                    {'right':
-                        {'+right':
-                            {'&bottom': STYLES[self.style]['rightinter'],
-                             '!&bottom': STYLES[self.style]['vertical']},
-                         '!+right':
-                            {'&bottom': STYLES[self.style]['bottomright'],
-                             '!&bottom': STYLES[self.style]['none']}},
-                     '!right':
-                        {'+right':
-                            {'&bottom': STYLES[self.style]['topright'],
-                             '!&bottom': STYLES[self.style]['none']},
-                         '!+right':
-                            {'&bottom': STYLES[self.style]['horizontal'],
-                             '!&bottom': STYLES[self.style]['none']}}})
+                symbol = self.get_symbol(row_idx, col_idx, borders['bottomright_lastcol'])
                 color = self.get_color(row_idx, col_idx, 0, 1) or cell.border_color
             elif last_row:
-                symbol = self.get_symbol(
-                    row_idx, col_idx,
-                    {'bottom':
-                        {'&right':
-                            {'+bottom': STYLES[self.style]['bottominter'],
-                             '!+bottom': STYLES[self.style]['bottomright']},
-                         '!&right':
-                            {'+bottom': STYLES[self.style]['horizontal'],
-                             '!+bottom': STYLES[self.style]['none']}},
-                     '!bottom':
-                        {'&right':
-                            {'+bottom': STYLES[self.style]['bottomleft'],
-                             '!+bottom': STYLES[self.style]['vertical']},
-                         '!&right':
-                            {'+bottom': STYLES[self.style]['none'],
-                             '!+bottom': STYLES[self.style]['none']}}})
+                symbol = self.get_symbol(row_idx, col_idx, borders['bottomright_lastrow'])
                 color = self.get_color(row_idx, col_idx, 1, 0) or cell.border_color
             else:
-                symbol = self.get_symbol(
-                    row_idx, col_idx,
-                    {'&right':
-                        {'&bottom':
-                            {'+&right':
-                                {'+&bottom': STYLES[self.style]['intersection'],
-                                 '!+&bottom': STYLES[self.style]['rightinter']},
-                             '!+&right':
-                                {'+&bottom': STYLES[self.style]['bottominter'],
-                                 '!+&bottom': STYLES[self.style]['bottomright']}},
-                         '!&bottom':
-                            {'+&right':
-                                {'+&bottom': STYLES[self.style]['leftinter'],
-                                 '!+&bottom': STYLES[self.style]['vertical']},
-                             '!+&right':
-                                {'+&bottom': STYLES[self.style]['bottomleft'],
-                                 '!+&bottom': STYLES[self.style]['none']}}},
-                     '!&right':
-                        {'&bottom':
-                            {'+&right':
-                                {'+&bottom': STYLES[self.style]['topinter'],
-                                 '!+&bottom': STYLES[self.style]['topright']},
-                             '!+&right':
-                                {'+&bottom': STYLES[self.style]['horizontal'],
-                                 '!+&bottom': STYLES[self.style]['none']}},
-                         '!&bottom':
-                            {'+&right':
-                                {'+&bottom': STYLES[self.style]['topleft'],
-                                 '!+&bottom': STYLES[self.style]['none']},
-                             '!+&right':
-                                {'+&bottom': STYLES[self.style]['horizontal'],
-                                 '!+&bottom': STYLES[self.style]['none']}}}})
+                symbol = self.get_symbol(row_idx, col_idx, borders['bottomright_inner'])
                 color = (self.get_color(row_idx, col_idx, 1, 1)
                       or self.get_color(row_idx, col_idx, 0, 1)
                       or self.get_color(row_idx, col_idx, 1, 0)
@@ -473,34 +633,19 @@ class TextTable(Table):
             return cell.border_color
 
     def get_symbol(self, row_idx, col_idx, mapping):
-        if not isinstance(mapping, dict):
+        if not isinstance(mapping, tuple):
             return mapping
 
-        key = list(reversed(sorted(mapping)))[0]
-        if key.startswith('+'):
-            key = key[1:]
-            if key.startswith('&'):
-                visibility = (
-                    self.get_visibility(row_idx + 1, col_idx, 1, 0, key[1:])
-                    if key in ('left', 'right')
-                    else self.get_visibility(row_idx, col_idx + 1, 0, 1, key[1:]))
-            else:
-                visibility = (
-                    getattr(self[row_idx + 1].cells[col_idx].border_visibility, key)
-                    if key in ('left', 'right')
-                    else getattr(self[row_idx].cells[col_idx + 1].border_visibility, key))
-            key = '+' + key
+        condition, visible, hidden = mapping
+        row_offset, col_offset, x, y, side = condition
+        if x is None:
+            visibility = getattr(
+                self[row_idx + row_offset].cells[col_idx + col_offset].border_visibility, side)
         else:
-            if key.startswith('&'):
-                visibility = (
-                    self.get_visibility(row_idx, col_idx, 1, 0, key[1:])
-                    if key in ('left', 'right')
-                    else self.get_visibility(row_idx, col_idx, 0, 1, key[1:]))
-            else:
-                visibility = getattr(self[row_idx].cells[col_idx].border_visibility, key)
+            visibility = self.get_visibility(
+                row_idx + row_offset, col_idx + col_offset, x, y, side)
 
-        key = '!' + key if not visibility else key
-        return self.get_symbol(row_idx, col_idx, mapping[key])
+        return self.get_symbol(row_idx, col_idx, visible if visibility else hidden)
 
     def get_visibility(self, row_idx, col_idx, x, y, side):
         cell = self[row_idx].cells[col_idx]
@@ -581,60 +726,41 @@ class TextTable(Table):
         return lines
 
     def _get_columns_widths(self):
-        columns_widths = []
-        # For each column, get minimal, defined, maximal and text width.
-        for row in self:
-            for col_idx, cell in enumerate(row.cells):
-                if col_idx >= len(columns_widths):
-                    columns_widths.append(ColumnWidths(-1, -1, -1, -1))
-                column_widths = columns_widths[col_idx]
-                column_widths.width = max((cell.width, column_widths.width))
-                column_widths.min_width = max((cell.get_min_width(), column_widths.min_width))
-                column_widths.max_width = max((cell.max_width, column_widths.max_width))
-                column_widths.text_width = max((cell.get_text_width(), column_widths.text_width))
-
-        # Distribute widths based on terminal width and number of borders.
-        remaining_size = term_width() - len(columns_widths) - 1
-        status = []
-        for column in columns_widths:
-            if column.width != -1:
-                self.widths.append(column.width)
-                status.append(True)
-                remaining_size -= column.width
-            else:
-                self.widths.append(column.min_width)
-                status.append(True if column.text_width <= column.min_width else False)
-                remaining_size -= column.min_width
-
-        while True:
-            if remaining_size <= 0 or all(status):
-                break
-
-            for idx, column in enumerate(columns_widths):
-                if status[idx]:
-                    continue
+        self.widths = get_columns_widths(self)
 
-                preferred_width = (
-                    column.max_width if column.max_width != -1 else column.text_width)
 
-                # Increment current column.
-                if self.widths[idx] < preferred_width:
-                    self.widths[idx] += 1
-                    remaining_size -= 1
+class TableGroup(Table):
+    """Group of text tables rendered one after another with the same column widths.
 
-                    # Mark column as done if column's width is equal to preferred width.
-                    if self.widths[idx] == preferred_width:
-                        status[idx] = True
-
-                    # Stop here if there is nothinh remaining.
-                    if remaining_size <= 0:
-                        break
+    Widths are computed once from the rows of all tables, with a single terminal
+    width lookup (none if ``available_width`` is given), and all tables use the same
+    compiled borders of the style. As for a text table, cells are split while
+    rendering so a group can only be flushed once."""
+    def __init__(self, page=False, output_file=None, style='modern', available_width=None):
+        Table.__init__(self, page, output_file)
+        self.style = style
+        self.available_width = available_width
+
+    def add_table(self, title=None):
+        table = TextTable([], title=title, style=self.style)
+        self.append(table)
+        return table
+
+    def _render(self):
+        """Yield the rendered lines of each table, ignoring empty tables."""
+        tables = [table for table in self if len(table)]
+        if not tables:
+            return
+        widths = get_columns_widths((row for table in tables for row in table),
+                                    self.available_width)
+        for table in tables:
+            nb_columns = max(len(row.cells) for row in table)
+            table.widths = widths[:nb_columns]
+            yield '\n'.join(''.join(line) for line in table.render())
 
-        # Check there is no overflow or throw a warning.
-        if remaining_size < 0:
-            logger.warn(
-                'unable to adapt size (terminal size: {:d}, overflow: {:d})!'
-                .format(term_width(), -remaining_size))
+    def flush(self):
+        self._output(self._render())
+        self.clear()
 
 
 class CsvTable(Table):
@@ -645,3 +771,8 @@ class CsvTable(Table):
 class DokuwikiTable(Table):
     def __init__(self, page=False, output_file=None):
         Table.__init__(self, page, output_file)
+
+
+register_format('text', TextTable)
+register_format('csv', CsvTable)
+register_format('dokuwiki', DokuwikiTable)